@@ -1,8 +1,18 @@
-from collections import UserDict
-from datetime import datetime, timedelta
+import csv
+import heapq
 import re
+import sys
+from datetime import date, timedelta
+
+# Exactly 10 ASCII digits, unlike isdigit() which also accepts other Unicode digits
+_PHONE_RE = re.compile(r"\A[0-9]{10}\Z")
+
+# Days to move a congratulation from the weekday (Monday=0) to the next working day
+_WEEKEND_BUMP = (timedelta(0),) * 5 + (timedelta(days=2), timedelta(days=1))
 
 class Field:
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -10,108 +20,324 @@ class Field:
         return str(self.value)
 
 class Name(Field):
+    __slots__ = ()
+
     def __init__(self, value):
         super().__init__(value)
         
 
 class Phone(Field):
+    __slots__ = ()
+
     def __init__(self, value):
         if not self.validate(value):
             raise ValueError("Invalid phone number format. Should start from 0 and be 10 digits")
         super().__init__(value)
 
     def validate(self, value):
-        # Validating phone number and raising exception if number is not 10 digits
-        return len(value) == 10 and value.isdigit()      
+        # Validating phone number with a single precompiled match
+        return _PHONE_RE.match(value) is not None
         
 class Birthday(Field):
+    __slots__ = ()
+
     def __init__(self, value):
-        if not self.validate(value):
+        birthday_date = self.parse(value)
+        if birthday_date is None:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
-        super().__init__(value)
+        super().__init__(birthday_date)
 
-    def validate(self, value):
+    def parse(self, value):
+        # Parsing DD.MM.YYYY by reordering it to ISO and letting date.fromisoformat validate it,
+        # returns None if the date is not valid
+        if len(value) != 10 or value[2] != "." or value[5] != ".":
+            return None
         try:
-            datetime.strptime(value, "%d.%m.%Y")
-            return True
+            return date.fromisoformat(f"{value[6:10]}-{value[3:5]}-{value[0:2]}")
         except ValueError:
-            return False   
+            return None
+
+    def __str__(self):
+        # strftime doesn't zero-pad years below 1000 on every platform
+        return f"{self.value.day:02d}.{self.value.month:02d}.{self.value.year:04d}"
+
+
+def birthday_in_year(month, day, year):
+    # 29 February is celebrated on 1 March in non-leap years
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return date(year, 3, 1)
+
+
+def get_congrats_date(month, day, today):
+    # Returns next birthday on or after today (as a date ordinal)
+    # and its congratulation date formatted as YYYY.MM.DD
+    next_birthday = birthday_in_year(month, day, today.year)
+    if next_birthday < today:
+        next_birthday = birthday_in_year(month, day, today.year + 1)
+    congrats_date = next_birthday + _WEEKEND_BUMP[next_birthday.weekday()]
+    congrats = f"{congrats_date.year:04d}.{congrats_date.month:02d}.{congrats_date.day:02d}"
+    return next_birthday.toordinal(), congrats
 
 
 class Record:
+    __slots__ = ("name", "phones", "birthday", "_str_cache", "_book")
+
     def __init__(self, name):
         self.name = Name(name)
-        self.phones = []
+        # Phone number -> Phone, so find/remove/edit don't scan the list
+        self.phones = {}
         self.birthday = None
-        
+        # Rendered __str__, reset whenever phones change
+        self._str_cache = None
+        # Address book holding the record, told about every change so its indexes stay in sync
+        self._book = None
+
     def add_phone(self, phone_number):
-        self.phones.append(Phone(phone_number))
+        phone = Phone(phone_number)
+        self.phones[phone.value] = phone
+        self._str_cache = None
+        if self._book is not None:
+            self._book.phone_added(self, phone.value)
 
     def remove_phone(self, phone_number):
-        for phone in self.phones:
-            if phone.value == phone_number:
-                self.phones.remove(phone)
+        if self.phones.pop(phone_number, None) is None:
+            return
+        self._str_cache = None
+        if self._book is not None:
+            self._book.phone_removed(self, phone_number)
 
     def edit_phone(self, old_phone, new_phone):
-        for phone in self.phones:
-            if phone.value == old_phone:
-                phone.value = new_phone
-                return
-        raise ValueError("Phone number not found")
+        if old_phone not in self.phones:
+            raise ValueError("Phone number not found")
+        phone = Phone(new_phone)
+        del self.phones[old_phone]
+        self.phones[phone.value] = phone
+        self._str_cache = None
+        if self._book is not None:
+            self._book.phone_removed(self, old_phone)
+            self._book.phone_added(self, phone.value)
         
     def find_phone(self, phone_number):
-        for phone in self.phones:
-            if phone.value == phone_number:
-                return phone
-        return None
+        return self.phones.get(phone_number)
     
     def add_birthday(self, new_birthday):
-        self.birthday = Birthday(new_birthday)
-            
+        birthday = Birthday(new_birthday)
+        if self._book is not None:
+            self._book.birthday_changed(self, self.birthday, birthday)
+        self.birthday = birthday
+
     def __str__(self):
-        return f"Contact name: {self.name.value}, phones: {'; '.join(p.value for p in self.phones)}"
+        if self._str_cache is None:
+            self._str_cache = f"Contact name: {self.name.value}, phones: {'; '.join(self.phones)}"
+        return self._str_cache
         
 
-class AddressBook(UserDict):
+class AddressBook(dict):
+    def __init__(self):
+        super().__init__()
+        # Phone number -> {name: record}, so lookups by phone don't scan every contact
+        self._phone_index = {}
+        # (month, day) -> {name: record}, so each birthday date is resolved once
+        # for everyone sharing it
+        self._bday_buckets = {}
+        # Min-heap of (next birthday ordinal, (month, day)) with exactly one entry per key
+        # of _bday_scheduled: keys are only pushed when first scheduled, rescheduled in place
+        # with heapreplace, and removed from both together
+        self._bday_heap = []
+        # (month, day) -> (next birthday ordinal, congratulation date)
+        self._bday_scheduled = {}
+
+    # Builds address book from a CSV file with one name,phone pair per line
+    @classmethod
+    def load_csv(cls, path):
+        book = cls()
+        with open(path, newline="", encoding="utf-8") as file:
+            for line_number, row in enumerate(csv.reader(file), start=1):
+                if not row:
+                    continue
+                if len(row) != 2:
+                    raise ValueError(f"Line {line_number}: expected name and phone")
+                name, phone = row[0].strip(), row[1].strip()
+                try:
+                    book.add_contact_phone(name, phone)
+                except ValueError as e:
+                    raise ValueError(f"Line {line_number}: {e}") from None
+        return book
+
+    # Adds phone to the named contact, creating the contact first if needed.
+    # Returns True if a new contact was created
+    def add_contact_phone(self, name, phone):
+        record = self.find(name)
+        if record:
+            record.add_phone(phone)
+            return False
+        record = Record(name)
+        record.add_phone(phone)
+        self.add_record(record)
+        return True
 
     # Adds new record to the address book
     def add_record(self, record):
-        self.data[record.name.value] = record
+        self[record.name.value] = record
+
+    # Every way of storing a record goes through here, so the indexes can't be skipped
+    def __setitem__(self, name, record):
+        if not isinstance(record, Record):
+            raise TypeError("Address book can only hold Record objects")
+        if name != record.name.value:
+            raise ValueError(f"Record {record.name.value} can't be stored as {name}")
+        # A record belongs to one book at a time, so it leaves the book it was in
+        old_book = record._book
+        if old_book is not None and old_book is not self and old_book.get(name) is record:
+            del old_book[name]
+        if name in self:
+            del self[name]
+        super().__setitem__(name, record)
+        record._book = self
+        for phone in record.phones:
+            self.phone_added(record, phone)
+        if record.birthday:
+            self._add_to_bucket(record, record.birthday, date.today())
+
+    # Every way of removing a record goes through here and drops it from the indexes
+    def __delitem__(self, name):
+        record = self[name]
+        super().__delitem__(name)
+        record._book = None
+        for phone in record.phones:
+            self.phone_removed(record, phone)
+        if record.birthday:
+            self._remove_from_bucket(record, record.birthday)
+
+    def pop(self, name, *default):
+        if name not in self:
+            if default:
+                return default[0]
+            raise KeyError(name)
+        record = self[name]
+        del self[name]
+        return record
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): address book is empty")
+        name = next(reversed(self))
+        return name, self.pop(name)
+
+    def clear(self):
+        for name in list(self):
+            del self[name]
+
+    def update(self, *args, **kwargs):
+        for name, record in dict(*args, **kwargs).items():
+            self[name] = record
+
+    def setdefault(self, name, record=None):
+        if name not in self:
+            self[name] = record
+        return self[name]
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    # Record -> book notifications: a record in a book reports each change through these
+    # public hooks, so the phone index and birthday buckets follow edits made on the record
+    def phone_added(self, record, phone_number):
+        self._phone_index.setdefault(phone_number, {})[record.name.value] = record
+
+    def phone_removed(self, record, phone_number):
+        # Several contacts may share a number, only this record's entry is dropped
+        holders = self._phone_index.get(phone_number)
+        if holders and holders.get(record.name.value) is record:
+            del holders[record.name.value]
+            if not holders:
+                del self._phone_index[phone_number]
+
+    # Moves record from the old birthday's (month, day) bucket to the new one's
+    def birthday_changed(self, record, old_birthday, new_birthday):
+        self._add_to_bucket(record, new_birthday, date.today())
+        if old_birthday:
+            old_key = (old_birthday.value.month, old_birthday.value.day)
+            new_key = (new_birthday.value.month, new_birthday.value.day)
+            if old_key != new_key:
+                self._remove_from_bucket(record, old_birthday)
+
+    def _add_to_bucket(self, record, birthday, today):
+        key = (birthday.value.month, birthday.value.day)
+        if key not in self._bday_scheduled:
+            self._schedule_birthday(key, today)
+        self._bday_buckets.setdefault(key, {})[record.name.value] = record
+
+    def _remove_from_bucket(self, record, birthday):
+        key = (birthday.value.month, birthday.value.day)
+        bucket = self._bday_buckets.get(key)
+        if bucket and bucket.get(record.name.value) is record:
+            del bucket[record.name.value]
+            if not bucket:
+                # Its heap entry stays scheduled and is dropped when popped,
+                # unless the date is reused by then
+                del self._bday_buckets[key]
+
+    # Pushes next birthday for the (month, day) bucket to the heap
+    def _schedule_birthday(self, key, today):
+        scheduled = get_congrats_date(*key, today)
+        self._bday_scheduled[key] = scheduled
+        heapq.heappush(self._bday_heap, (scheduled[0], key))
+
+    # Searches for records using phone
+    def find_phone(self, phone_number):
+        return list(self._phone_index.get(phone_number, {}).values())
 
     # Seaches for phone using name
     def find(self, name):
-        return self.data.get(name, None)
+        return self.get(name)
 
     # Deletes phone
     def delete(self, name):
-        if name in self.data:
-            del self.data[name]
+        if name in self:
+            del self[name]
 
     # Check birthdays
     def get_upcoming_birthdays(self):
-        today = datetime.now().date()
+        today = date.today()
         upcoming_birthdays = []
 
-        for record in self.data.values():
-            if record.birthday:
-                birthday_date = datetime.strptime(record.birthday.value, "%d.%m.%Y").date()
-                birthday_this_year = birthday_date.replace(year=today.year)
-
-                if birthday_this_year < today:
-                    birthday_this_year = birthday_this_year.replace(year=today.year + 1)
-
-                days_until_birthday = (birthday_this_year - today).days
-
-                if 0 <= days_until_birthday <= 7:
-                    congratulation_date = birthday_this_year
-
-                    if congratulation_date.weekday() >= 5:  # Saturday or Sunday
-                        congratulation_date += timedelta(days=(7 - congratulation_date.weekday()))
+        # Integer day numbers keep the heap and window comparisons cheap
+        today_ord = today.toordinal()
+        limit = today_ord + 7
+        heap = self._bday_heap
+        due = []
 
+        # Only the entries up to a week ahead are popped, passed birthdays are rescheduled.
+        # Entries are looked at before popping and the due ones are pushed back even on error,
+        # so a failing query can't drop a bucket from the heap
+        try:
+            while heap and heap[0][0] <= limit:
+                birthday_ord, key = heap[0]
+                if key not in self._bday_buckets:
+                    heapq.heappop(heap)
+                    del self._bday_scheduled[key]
+                    continue
+                scheduled = self._bday_scheduled[key]
+                if birthday_ord < today_ord:
+                    scheduled = get_congrats_date(*key, today)
+                    self._bday_scheduled[key] = scheduled
+                    heapq.heapreplace(heap, (scheduled[0], key))
+                    continue
+
+                due.append(heapq.heappop(heap))
+                congratulation_date = scheduled[1]
+                for name in self._bday_buckets[key]:
                     upcoming_birthdays.append({
-                        "name": record.name.value,
-                        "congratulation_date": congratulation_date.strftime("%Y.%m.%d")
+                        "name": name,
+                        "congratulation_date": congratulation_date
                     })
+        finally:
+            for entry in due:
+                heapq.heappush(heap, entry)
 
         return upcoming_birthdays
     
@@ -129,20 +355,18 @@ def input_error(func):
             return f"An error occurred: {e}"
     return inner
 
+def hello(args, book):
+    return "How can I help you?"
+
 @input_error
 def add_contact(args, book):
     if len(args) != 2:
         raise ValueError("Give me name and phone please.")
     name, phone = args
-    record = book.find(name)
-    if record:
-        record.add_phone(phone)
-        return "Phone added."
-    else:
-        record = Record(name)
-        record.add_phone(phone)
-        book.add_record(record)
+    if book.add_contact_phone(name, phone):
         return "Contact added."
+    else:
+        return "Phone added."
 
 @input_error
 def change_contact(args, book):
@@ -163,12 +387,23 @@ def show_phone(args, book):
     name = args[0]
     record = book.find(name)
     if record:
-        return '; '.join(phone.value for phone in record.phones)
+        return '; '.join(record.phones)
     else:
         raise KeyError(name)
 
 @input_error
-def show_all(book):
+def find_phone(args, book):
+    if len(args) != 1:
+        raise ValueError("Enter phone number")
+    phone = args[0]
+    records = book.find_phone(phone)
+    if records:
+        return '\n'.join(str(record) for record in records)
+    else:
+        raise KeyError(phone)
+
+@input_error
+def show_all(args, book):
     return '\n'.join(str(record) for record in book.values())
 
 @input_error
@@ -190,53 +425,70 @@ def show_birthday(args, book):
     name = args[0]
     record = book.find(name)
     if record and record.birthday:
-        return f"{name}'s birthday: {record.birthday.value}"
+        return f"{name}'s birthday: {record.birthday}"
     elif record:
         return f"{name} has no birthday set."
     else:
         raise KeyError(name)
 
 @input_error
-def birthdays(book):
+def birthdays(args, book):
     upcoming = book.get_upcoming_birthdays()
     if upcoming:
         return '\n'.join(f"{b['name']}: {b['congratulation_date']}" for b in upcoming)
     else:
         return "No upcoming birthdays in the next week."
 
+EXIT_COMMANDS = frozenset(("close", "exit"))
+
+# Command name -> handler taking (args, book) and returning the text to print
+COMMANDS = {
+    "hello": hello,
+    "add": add_contact,
+    "change": change_contact,
+    "phone": show_phone,
+    "find-phone": find_phone,
+    "all": show_all,
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+    "birthdays": birthdays,
+}
+
 def parse_input(user_input):
-    cmd, *args = re.findall(r'\S+', user_input)
-    cmd = cmd.strip().lower()
-    return cmd, args
+    # No command takes more than 3 arguments: any extra words stay in a 4th one
+    # so the argument count checks still fail
+    parts = user_input.split(None, 4)
+    cmd = parts[0].lower() if parts else ""
+    return cmd, parts[1:]
 
 def main():
     book = AddressBook()
-    print("Welcome to the assistant bot!")
+    commands = COMMANDS
+    write = sys.stdout.write
+    # Piped input: no prompts and plain readline, output is flushed once at the end
+    interactive = sys.stdin.isatty()
+    readline = sys.stdin.readline
+
+    write("Welcome to the assistant bot!\n")
     while True:
-        user_input = input("Enter a command: ")
+        if interactive:
+            try:
+                user_input = input("Enter a command: ")
+            except EOFError:
+                break
+        else:
+            user_input = readline()
+            if not user_input:
+                break
         command, args = parse_input(user_input)
 
-        if command in ["close", "exit"]:
-            print("Good bye!")
+        if command in EXIT_COMMANDS:
+            write("Good bye!\n")
             break
-        elif command == "hello":
-            print("How can I help you?")
-        elif command == "add":
-            print(add_contact(args, book))
-        elif command == "change":
-            print(change_contact(args, book))
-        elif command == "phone":
-            print(show_phone(args, book))
-        elif command == "all":
-            print(show_all(book))
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
-        elif command == "birthdays":
-            print(birthdays(book))
-        else:
-            print("Invalid command.")
+
+        handler = commands.get(command)
+        write(f"{handler(args, book)}\n" if handler else "Invalid command.\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
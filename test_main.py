@@ -0,0 +1,293 @@
+import io
+import os
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+import main
+
+
+class FakeDate(date):
+    current = date(2026, 1, 1)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+class LeapDayBirthdayTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(main, "date", FakeDate)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_leap_day_added_in_non_leap_year(self):
+        FakeDate.current = date(2026, 2, 25)
+        book = main.AddressBook()
+        record = main.Record("Ann")
+        book.add_record(record)
+
+        self.assertEqual(main.add_birthday(["Ann", "29.02.2000"], book), "Birthday added.")
+        self.assertEqual(str(record.birthday), "29.02.2000")
+        self.assertEqual(
+            book.get_upcoming_birthdays(), [{"name": "Ann", "congratulation_date": "2026.03.02"}]
+        )
+
+    def test_leap_day_survives_rollover(self):
+        FakeDate.current = date(2028, 2, 25)
+        book = main.AddressBook()
+        record = main.Record("Ann")
+        record.add_birthday("29.02.2000")
+        book.add_record(record)
+        self.assertEqual(
+            book.get_upcoming_birthdays(), [{"name": "Ann", "congratulation_date": "2028.02.29"}]
+        )
+
+        FakeDate.current = date(2029, 2, 25)
+        self.assertEqual(
+            book.get_upcoming_birthdays(), [{"name": "Ann", "congratulation_date": "2029.03.01"}]
+        )
+
+        FakeDate.current = date(2032, 2, 25)
+        self.assertEqual(
+            book.get_upcoming_birthdays(), [{"name": "Ann", "congratulation_date": "2032.03.01"}]
+        )
+
+
+
+class AddressBookMappingTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(main, "date", FakeDate)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        FakeDate.current = date(2026, 3, 10)
+        self.book = main.AddressBook()
+
+    def make_record(self, name, phone, birthday="12.03.1990"):
+        record = main.Record(name)
+        record.add_phone(phone)
+        record.add_birthday(birthday)
+        return record
+
+    def assert_indexed(self, record):
+        self.assertIs(record._book, self.book)
+        for phone in record.phones:
+            self.assertIn(record, self.book.find_phone(phone))
+        names = [b["name"] for b in self.book.get_upcoming_birthdays()]
+        self.assertIn(record.name.value, names)
+
+    def assert_unindexed(self, record):
+        self.assertIsNone(record._book)
+        for phone in record.phones:
+            self.assertNotIn(record, self.book.find_phone(phone))
+        names = [b["name"] for b in self.book.get_upcoming_birthdays()]
+        self.assertNotIn(record.name.value, names)
+
+    def test_setitem(self):
+        ann = self.make_record("Ann", "0123456789")
+        self.book["Ann"] = ann
+        self.assert_indexed(ann)
+
+    def test_setitem_rejects_mismatched_name_and_non_records(self):
+        with self.assertRaises(ValueError):
+            self.book["Bob"] = self.make_record("Ann", "0123456789")
+        with self.assertRaises(TypeError):
+            self.book["Ann"] = "0123456789"
+        self.assertEqual(len(self.book), 0)
+
+    def test_setitem_replaces_existing_record(self):
+        old = self.make_record("Ann", "0123456789")
+        new = self.make_record("Ann", "1111111111")
+        self.book.add_record(old)
+        self.book["Ann"] = new
+        self.assertIsNone(old._book)
+        self.assertEqual(self.book.find_phone("0123456789"), [])
+        self.assert_indexed(new)
+        self.assertEqual(len(self.book.get_upcoming_birthdays()), 1)
+
+    def test_delitem(self):
+        ann = self.make_record("Ann", "0123456789")
+        self.book.add_record(ann)
+        del self.book["Ann"]
+        self.assertEqual(len(self.book), 0)
+        self.assert_unindexed(ann)
+
+    def test_pop(self):
+        ann = self.make_record("Ann", "0123456789")
+        self.book.add_record(ann)
+        self.assertIs(self.book.pop("Ann"), ann)
+        self.assert_unindexed(ann)
+        self.assertIsNone(self.book.pop("Ann", None))
+        with self.assertRaises(KeyError):
+            self.book.pop("Ann")
+
+    def test_popitem(self):
+        ann = self.make_record("Ann", "0123456789")
+        self.book.add_record(ann)
+        self.assertEqual(self.book.popitem(), ("Ann", ann))
+        self.assert_unindexed(ann)
+        with self.assertRaises(KeyError):
+            self.book.popitem()
+
+    def test_clear(self):
+        ann = self.make_record("Ann", "0123456789")
+        bob = self.make_record("Bob", "1111111111")
+        self.book.add_record(ann)
+        self.book.add_record(bob)
+        self.book.clear()
+        self.assertEqual(len(self.book), 0)
+        self.assert_unindexed(ann)
+        self.assert_unindexed(bob)
+
+    def test_update(self):
+        bob = self.make_record("Bob", "1111111111")
+        self.book.update({"Bob": bob})
+        self.assert_indexed(bob)
+
+    def test_inplace_or(self):
+        bob = self.make_record("Bob", "1111111111")
+        self.book |= {"Bob": bob}
+        self.assert_indexed(bob)
+
+    def test_setdefault(self):
+        ann = self.make_record("Ann", "0123456789")
+        self.assertIs(self.book.setdefault("Ann", ann), ann)
+        self.assert_indexed(ann)
+        other = self.make_record("Ann", "1111111111")
+        self.assertIs(self.book.setdefault("Ann", other), ann)
+        self.assertEqual(self.book.find_phone("1111111111"), [])
+
+
+    def test_record_moves_between_books(self):
+        ann = self.make_record("Ann", "0123456789")
+        self.book.add_record(ann)
+        other = main.AddressBook()
+        other.add_record(ann)
+        ann.add_phone("1111111111")
+
+        self.assertNotIn("Ann", self.book)
+        self.assertEqual(self.book.find_phone("0123456789"), [])
+        self.assertEqual(self.book.get_upcoming_birthdays(), [])
+        self.assertIs(ann._book, other)
+        self.assertEqual(other.find_phone("1111111111"), [ann])
+
+
+
+class PhoneIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.book = main.AddressBook()
+        main.add_contact(["Ann", "0123456789"], self.book)
+        main.add_contact(["Bob", "0123456789"], self.book)
+        self.ann = self.book.find("Ann")
+        self.bob = self.book.find("Bob")
+
+    def test_add_indexes_every_holder(self):
+        self.assertEqual(self.book.find_phone("0123456789"), [self.ann, self.bob])
+        self.assertEqual(self.book.find_phone("1111111111"), [])
+
+    def test_edit_keeps_other_holders_findable(self):
+        main.change_contact(["Ann", "0123456789", "1111111111"], self.book)
+        self.assertEqual(self.book.find_phone("0123456789"), [self.bob])
+        self.assertEqual(self.book.find_phone("1111111111"), [self.ann])
+
+        main.change_contact(["Bob", "0123456789", "2222222222"], self.book)
+        self.assertEqual(self.book.find_phone("0123456789"), [])
+        self.assertEqual(self.book.find_phone("2222222222"), [self.bob])
+
+    def test_failed_edit_leaves_index_alone(self):
+        self.assertEqual(main.change_contact(["Ann", "0123456789", "12"], self.book),
+                         "Invalid phone number format. Should start from 0 and be 10 digits")
+        self.assertEqual(self.book.find_phone("0123456789"), [self.ann, self.bob])
+
+    def test_remove_drops_only_that_record(self):
+        self.ann.remove_phone("0123456789")
+        self.assertEqual(self.book.find_phone("0123456789"), [self.bob])
+        self.bob.remove_phone("0123456789")
+        self.assertEqual(self.book.find_phone("0123456789"), [])
+
+    def test_delete_drops_only_that_record(self):
+        self.book.delete("Bob")
+        self.assertEqual(self.book.find_phone("0123456789"), [self.ann])
+
+    def test_find_phone_command(self):
+        self.assertEqual(main.find_phone(["0123456789"], self.book),
+                         "Contact name: Ann, phones: 0123456789\n"
+                         "Contact name: Bob, phones: 0123456789")
+        self.assertEqual(main.find_phone(["1111111111"], self.book),
+                         "Contact '1111111111' not found.")
+        self.assertEqual(main.find_phone([], self.book), "Enter phone number")
+
+
+class LoadCsvTest(unittest.TestCase):
+    def load(self, text):
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", encoding="utf-8", delete=False
+        ) as file:
+            file.write(text)
+        self.addCleanup(os.remove, file.name)
+        return main.AddressBook.load_csv(file.name)
+
+    def test_merges_rows_by_name_and_strips_fields(self):
+        book = self.load("Ann,0123456789\n Bob , 1111111111 \nAnn,2222222222\n")
+        self.assertEqual(list(book), ["Ann", "Bob"])
+        self.assertEqual(list(book.find("Ann").phones), ["0123456789", "2222222222"])
+        self.assertEqual(list(book.find("Bob").phones), ["1111111111"])
+        self.assertEqual(book.find_phone("2222222222"), [book.find("Ann")])
+
+    def test_skips_blank_rows(self):
+        book = self.load("\nAnn,0123456789\n\n\nBob,1111111111\n")
+        self.assertEqual(list(book), ["Ann", "Bob"])
+
+    def test_rejects_wrong_column_count(self):
+        with self.assertRaisesRegex(ValueError, "^Line 2: expected name and phone$"):
+            self.load("Ann,0123456789\nBob,1111111111,extra\n")
+        with self.assertRaisesRegex(ValueError, "^Line 1: expected name and phone$"):
+            self.load("Ann\n")
+
+    def test_reports_invalid_phone_with_line_number(self):
+        with self.assertRaisesRegex(ValueError, "^Line 3: Invalid phone number format"):
+            self.load("Ann,0123456789\n\nBob,12345\n")
+
+
+
+class PipedMainTest(unittest.TestCase):
+    def run_main(self, text):
+        stdin, stdout = io.StringIO(text), io.StringIO()
+        with mock.patch.object(main.sys, "stdin", stdin), \
+                mock.patch.object(main.sys, "stdout", stdout):
+            main.main()
+        return stdout.getvalue(), stdin.read()
+
+    def test_runs_script_without_prompts_until_eof(self):
+        output, rest = self.run_main("hello\nadd Ann 0123456789\n\nall\nphone Ann")
+        self.assertEqual(output, "Welcome to the assistant bot!\n"
+                                 "How can I help you?\n"
+                                 "Contact added.\n"
+                                 "Invalid command.\n"
+                                 "Contact name: Ann, phones: 0123456789\n"
+                                 "0123456789\n")
+        self.assertEqual(rest, "")
+
+    def test_exit_stops_reading(self):
+        output, rest = self.run_main("hello\nexit\nhello\n")
+        self.assertEqual(output, "Welcome to the assistant bot!\n"
+                                 "How can I help you?\n"
+                                 "Good bye!\n")
+        self.assertEqual(rest, "hello\n")
+
+    def test_empty_input(self):
+        output, _ = self.run_main("")
+        self.assertEqual(output, "Welcome to the assistant bot!\n")
+
+    def test_flushes_once_at_the_end(self):
+        stdout = io.StringIO()
+        with mock.patch.object(main.sys, "stdin", io.StringIO("hello\n")), \
+                mock.patch.object(main.sys, "stdout", stdout), \
+                mock.patch.object(stdout, "flush") as flush:
+            main.main()
+        flush.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()